@@ -5,6 +5,7 @@
     
     tested in BrainVoyager 23.0.9 on macOS 12.5 (Apple Silicon) with 1 nested directory level 
     not tested yet: 1. unicode paths # os.walk(u".") 2. other operating systems 3. filenames with spaces 
+    note: skipexisting only checks the VTC filename; a VTC made with another exttal setting or left incomplete by an interrupted run is kept as is
     
     240219hb
 '''
@@ -15,38 +16,43 @@ import os
 resolution      = 2
 interpolation   = 2  # 0 -> nearest neighbour, 1 -> trilinear, 2 -> sinc
 exttal          = False
+skipexisting    = False  # True -> do not recreate existing VTCs (name check only)
 datapath        = brainvoyager.choose_directory("Please select the top directory") # brainvoyager.sampledata_path + 'GSGData'
 # ------------------------------
 
+vtcsuffix = '_res'+str(resolution)+'_interp'+str(interpolation)+'_MNI.vtc'
+
 for currentdir, subdirs, filenames in os.walk(datapath):
     vtcfiles = dict() # {'VMR', 'FMR', 'IA', 'FA', 'MNI'} 
     brainvoyager.print_to_log('Reset files...')
     brainvoyager.print_to_log('Current directory: ' + currentdir)
     for filename in filenames:           
-        print('Current directory: ' + currentdir) 
         if filename.endswith('.fmr') and not filename.endswith('_firstvol.fmr'): 
             vtcfiles['FMR'] = os.path.join(currentdir, filename)
             brainvoyager.print_to_log('FMR found: ' + vtcfiles['FMR'])
-        if filename.endswith('.vmr'):     
+        elif filename.endswith('.vmr'):     
             vtcfiles['VMR'] = os.path.join(currentdir, filename)
             brainvoyager.print_to_log('VMR found: ' + vtcfiles['VMR'])
-        if filename.endswith('_IA.trf'):     
+        elif filename.endswith('_IA.trf'):     
             vtcfiles['IA'] = os.path.join(currentdir, filename)     
             brainvoyager.print_to_log('Initial alignment file found: ' + vtcfiles['IA'])       
-        if filename.endswith('_FA.trf'):     
+        elif filename.endswith('_FA.trf'):     
             vtcfiles['FA'] = os.path.join(currentdir, filename)
             brainvoyager.print_to_log('Fine alignment file found: ' + vtcfiles['FA']) 
-        if filename.endswith('MNI_a12.trf'):     
+        elif filename.endswith('MNI_a12.trf'):     
             vtcfiles['MNI'] = os.path.join(currentdir, filename)
             brainvoyager.print_to_log('MNI normalisation file found: ' + vtcfiles['MNI']) 
         if (len(vtcfiles.values()) == 5):    
             brainvoyager.print_to_log('Number of unique file types found: ' + str(len(vtcfiles)))    
-            brainvoyager.print_to_log('All files present, proceed with creating VTC...')
-            doc = brainvoyager.open_document(vtcfiles['VMR'])
-            newname = os.path.join(currentdir, vtcfiles['FMR'].split(".fmr", 1)[0]+'_res'+str(resolution)+'_interp'+str(interpolation)+"_MNI.vtc")
-            doc.vtc_creation_extended_tal_space = exttal
-            brainvoyager.print_to_log('Creating ' + newname + ' from:' +'\n' +'\t'+vtcfiles['FMR'] + '\n' +'\t'+ vtcfiles['IA'] + '\n'+ '\t'+ vtcfiles['FA'] + '\n' +'\t'+ vtcfiles['MNI'])
-            ok = doc.create_vtc_in_mni_space(vtcfiles['FMR'], vtcfiles['IA'], vtcfiles['FA'], vtcfiles['MNI'], newname, resolution, interpolation)
-            doc.close() 
+            newname = vtcfiles['FMR'].split(".fmr", 1)[0] + vtcsuffix
+            if skipexisting and os.path.isfile(newname):
+                brainvoyager.print_to_log('VTC already exists, skipping: ' + newname)
+            else:
+                brainvoyager.print_to_log('All files present, proceed with creating VTC...')
+                doc = brainvoyager.open_document(vtcfiles['VMR'])
+                doc.vtc_creation_extended_tal_space = exttal
+                brainvoyager.print_to_log('Creating ' + newname + ' from:' +'\n' +'\t'+vtcfiles['FMR'] + '\n' +'\t'+ vtcfiles['IA'] + '\n'+ '\t'+ vtcfiles['FA'] + '\n' +'\t'+ vtcfiles['MNI'])
+                ok = doc.create_vtc_in_mni_space(vtcfiles['FMR'], vtcfiles['IA'], vtcfiles['FA'], vtcfiles['MNI'], newname, resolution, interpolation)
+                doc.close() 
             vtcfiles = dict() # reset   
        
@@ -1,8 +1,10 @@
 ''' Simple script to move the last 5 dicom (noise volumes) files to a subfolder '''
  
 import os
+import errno
+import heapq
 import shutil
-from glob import glob
+from fnmatch import fnmatch
 
 datapath = brainvoyager.choose_directory("Please select the top directory") # brainvoyager.sampledata_path + 'GSGData'
             
@@ -11,15 +13,27 @@ def last_8chars(x):
         
 for currentdir, subdirs, filenames in os.walk(datapath):
 
-    file_list2 = glob(os.path.join(currentdir, "*.dcm"))    
-    sortedlist = sorted(file_list2, key = last_8chars)     
-    listlen = len(sortedlist)
+    # os.walk already listed this directory; match and skip hidden files like glob does
+    dcmfiles = [f for f in filenames if fnmatch(f, '*.dcm') and not f.startswith('.')]
+    listlen = len(dcmfiles)
     brainvoyager.print_to_log('Length of list list in directory ' + currentdir + ': ' + str(listlen))
     if listlen > 10:
         tmpdir = os.path.join(currentdir, 'last5vols')
         if not os.path.exists(tmpdir):
             os.makedirs(tmpdir)
             brainvoyager.print_to_log('Created directory: ' + tmpdir)    
-        for noise_volumes in range(listlen-5, listlen):    
-            brainvoyager.print_to_log('Moving ' + sortedlist[noise_volumes])    
-            shutil.move(sortedlist[noise_volumes], tmpdir) 
\ No newline at end of file
+        # same 5 files, in the same order, as sorted(...)[-5:]: ties keep the later listed files
+        last5 = heapq.nlargest(5, enumerate(dcmfiles), key = lambda x: (last_8chars(os.path.join(currentdir, x[1])), x[0]))
+        for _, noise_volume in reversed(last5):
+            source = os.path.join(currentdir, noise_volume)
+            destination = os.path.join(tmpdir, noise_volume)
+            if os.path.exists(destination):
+                brainvoyager.print_to_log('Not moving ' + source + ', destination already exists: ' + destination)
+                continue
+            brainvoyager.print_to_log('Moving ' + source)
+            try:
+                os.replace(source, destination)
+            except OSError as e:
+                if e.errno != errno.EXDEV:
+                    raise
+                shutil.move(source, destination)  # last5vols is a symlink to another filesystem
\ No newline at end of file